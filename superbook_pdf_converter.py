@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""DN_SuperBook_PDF_Converter (Intel NPU edition) - CLI skeleton.
+
+Python 版の処理フロー骨格。現時点では入力 PDF の収集・出力先へのコピーと、
+OCR 出力 (検索可能 PDF / HTML / Markdown / JSON) のプレースホルダ生成までを
+実装する。AI 鮮明化と YomiToku OCR の本処理は今後ここに組み込む。
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib.util
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger("superbook")
+
+# Bound method of the compiled pattern: one C-level match per filename,
+# no per-entry lowercased-string allocation.
+_PDF_RE = re.compile(r"\.pdf\Z", re.IGNORECASE).search
+
+# json and shutil are only needed once real work starts; defer them so
+# cold CLI start-up (argparse errors, --help, empty runs) stays cheap.
+_LAZY_MODULES = ("json", "shutil")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return importlib.import_module(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def detect_backend() -> str:
+    """Return ``"NPU"`` when OpenVINO is importable, otherwise ``"CPU"``.
+
+    The probe walks ``sys.path``, so the result is memoized; repeat
+    callers pay nothing after the first lookup.
+    """
+    if "openvino" in sys.modules:
+        return "NPU"
+    # Probing "openvino.runtime" would import the parent package anyway,
+    # so checking the parent alone is sufficient and strictly cheaper.
+    try:
+        return "NPU" if importlib.util.find_spec("openvino") is not None else "CPU"
+    except (ValueError, ModuleNotFoundError):
+        return "CPU"
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_loader():
+    """Resolve the fastest available PyYAML loader exactly once.
+
+    Prefers the libyaml-backed ``CSafeLoader`` (5-15x faster than the
+    pure-Python ``SafeLoader``) and falls back when PyYAML was built
+    without libyaml.
+    """
+    import yaml
+
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+    return yaml, loader
+
+
+def load_config(path: Path) -> dict:
+    """Load a YAML or JSON config file into a dict.
+
+    YAML configs are mirrored into a ``.cache.json`` sibling keyed on the
+    source mtime, so repeat invocations parse the much faster JSON copy
+    instead of re-running the YAML loader.
+    """
+    import json
+
+    # The parsers below all consume binary file objects directly (json's
+    # C scanner and libyaml both decode UTF-8 natively), avoiding the
+    # whole-file str that read_text would materialize before parsing.
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        cache = path.with_suffix(path.suffix + ".cache.json")
+        try:
+            if cache.stat().st_mtime >= path.stat().st_mtime:
+                with cache.open("rb") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass  # missing/stale/corrupt cache: fall through and re-parse
+        yaml, loader = _yaml_loader()
+        with path.open("rb") as f:
+            result = yaml.load(f, Loader=loader) or {}
+        try:
+            cache.write_bytes(_dump_json_bytes(result))
+        except (OSError, TypeError):
+            pass  # read-only config dir or unserializable value: cache skipped
+        return result
+    with path.open("rb") as f:
+        return json.load(f) or {}
+
+
+def _iter_pdfs(root: Path, recursive: bool):
+    """Yield PDF paths below *root* via ``os.walk``.
+
+    ``os.walk`` rides the same scandir/d_type fast path as the previous
+    hand-rolled stack walker, but exposes ``dirnames`` for in-place
+    pruning: hidden directories are dropped before they are ever
+    descended into, so large irrelevant subtrees cost nothing.
+    """
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if _PDF_RE(name):
+                yield Path(dirpath) / name
+        if not recursive:
+            break
+
+
+def collect_pdfs(input_dir: Path, recursive: bool):
+    """Yield ``(pdf_path, base_dir)`` for every PDF under *input_dir*.
+
+    A generator rather than a list so callers can start copying as soon
+    as the walker discovers the first file, instead of waiting for the
+    full traversal; peak memory no longer scales with file count.
+    """
+    found = False
+    for candidate in _iter_pdfs(input_dir, recursive):
+        found = True
+        yield candidate, input_dir
+    if not found:
+        logger.warning("no PDF files found under %s", input_dir)
+
+
+# Constant halves of the placeholder documents, hoisted to module scope
+# as bytes so each call is a join plus one encode of the source path,
+# with no per-file f-string formatting.
+_HTML_PRE = b"<html><body><h1>OCR placeholder</h1><p>Source: "
+_HTML_POST = b"</p></body></html>\n"
+_MD_PRE = b"# OCR placeholder\n\nSource: "
+_MD_POST = b"\n"
+
+
+def _dump_json_bytes(obj: dict) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes on the fastest available path.
+
+    Prefers orjson when installed; otherwise uses json.dumps in compact
+    form, which stays on the C-accelerated serializer (indentation would
+    route through the pure-Python pretty-printer).
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(obj)
+
+
+def write_ocr_placeholders(output_pdf: Path, source_pdf: Path) -> None:
+    """Emit placeholder OCR artifacts next to *output_pdf*.
+
+    Until the YomiToku pipeline is wired up, produce the searchable-PDF
+    clone plus HTML / Markdown / JSON stubs so downstream consumers can
+    already rely on the final file layout.
+    """
+    import shutil
+
+    ocr_pdf = output_pdf.with_suffix(".ocr.pdf")
+    # copyfile, not copy2: this clone is process-owned scratch output, so
+    # the extra stat/utime/chmod round of metadata copying buys nothing,
+    # and on Linux copyfile routes through copy_file_range/sendfile.
+    shutil.copyfile(output_pdf, ocr_pdf)
+    source = str(source_pdf)
+    src_bytes = source.encode("utf-8")
+    payloads = (
+        (output_pdf.with_suffix(".html"), b"".join((_HTML_PRE, src_bytes, _HTML_POST))),
+        (output_pdf.with_suffix(".md"), b"".join((_MD_PRE, src_bytes, _MD_POST))),
+        (
+            output_pdf.with_suffix(".json"),
+            _dump_json_bytes({"source": source, "status": "pending"}),
+        ),
+    )
+    # Sequential on purpose: this function already runs inside main()'s
+    # worker pool, so a nested per-call executor costs more than the
+    # three small writes it would overlap -- and lets write errors
+    # propagate to the per-file handling in main().
+    for path, content in payloads:
+        path.write_bytes(content)
+
+
+def _output_path(pdf_path: Path, base_dir: Path, output_dir: Path) -> Path:
+    try:
+        relative = pdf_path.relative_to(base_dir)
+    except ValueError:
+        # Disambiguate out-of-tree inputs with a digest that is stable
+        # across runs -- hash() is salted per process, so it would map the
+        # same PDF to a different output name on every invocation.
+        import hashlib
+
+        digest = hashlib.blake2b(str(pdf_path).encode("utf-8"), digest_size=6).hexdigest()
+        relative = Path(f"{pdf_path.stem}_{digest}{pdf_path.suffix}")
+    return output_dir / relative
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create *path* once per run; repeat calls for the same dir are free.
+
+    The lru_cache keeps mkdir/stat traffic at O(unique dirs) even though
+    files now stream in one at a time, and it is thread-safe, so worker
+    threads never race on mkdir. main() clears it between runs.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst* kernel-side where possible, preserving mtime.
+
+    ``os.copy_file_range`` moves the data without any user-space
+    buffering and can reflink on btrfs/xfs, making same-filesystem
+    copies near-free. Cross-filesystem copies (EXDEV) and platforms
+    without the syscall fall back to ``shutil.copyfile``. Source
+    timestamps are carried over with a single ``utime`` so the output
+    stays comparable against the input on later runs.
+    """
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining:
+                written = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if written == 0:
+                    break
+                remaining -= written
+    except (AttributeError, OSError):
+        import shutil
+
+        shutil.copyfile(src, dst)
+    st = src.stat()
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _is_up_to_date(src: Path, dst: Path) -> bool:
+    """True when *dst* already matches *src* by size and whole-second mtime.
+
+    _fast_copy carries the source timestamps over, so two stat calls are
+    enough to spare an unchanged PDF a full re-copy on repeat runs.
+    """
+    try:
+        dst_stat = dst.stat()
+    except OSError:
+        return False
+    src_stat = src.stat()
+    return (
+        src_stat.st_size == dst_stat.st_size
+        and int(src_stat.st_mtime) == int(dst_stat.st_mtime)
+    )
+
+
+def _process_one(pdf_path: Path, base_dir: Path, output_dir: Path, ocr: bool) -> None:
+    """Copy one PDF into *output_dir* and emit OCR placeholders when asked."""
+    output_pdf = _output_path(pdf_path, base_dir, output_dir)
+    _ensure_dir(output_pdf.parent)
+    if not _is_up_to_date(pdf_path, output_pdf):
+        _fast_copy(pdf_path, output_pdf)
+    if ocr:
+        write_ocr_placeholders(output_pdf, pdf_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated main() calls reuse it."""
+    parser = argparse.ArgumentParser(
+        prog="convertpdf",
+        description="DN_SuperBook PDF converter (Intel NPU edition)",
+    )
+    parser.add_argument("src_dir", type=Path, help="input directory containing scanned PDFs")
+    parser.add_argument("dst_dir", type=Path, help="output directory")
+    parser.add_argument("--ocr", action="store_true", help="emit OCR outputs (placeholder)")
+    parser.add_argument("--recursive", action="store_true", help="descend into subdirectories")
+    parser.add_argument("--config", type=Path, default=None, help="YAML/JSON config file")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    # Respect logging already configured by an embedding application or
+    # test harness; only install the default handler on a bare root.
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    input_dir = args.src_dir.resolve()
+    output_dir = args.dst_dir.resolve()
+    if input_dir == output_dir:
+        parser.error("src_dir and dst_dir must not be the same directory")
+
+    config = load_config(args.config) if args.config else {}
+    ocr = args.ocr or bool(config.get("ocr"))
+    logger.info("inference backend: %s", detect_backend())
+
+    _ensure_dir.cache_clear()
+    failures = 0
+    # Feed the executor straight from the generator: the directory walk
+    # and the copies overlap instead of running as two serial phases.
+    with ThreadPoolExecutor(max_workers=min(32, 4 * (os.cpu_count() or 1))) as executor:
+        futures = {
+            executor.submit(_process_one, p, b, output_dir, ocr): p
+            for p, b in collect_pdfs(input_dir, args.recursive)
+        }
+        for future, pdf_path in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                failures += 1
+                logger.error("failed to process %s: %s", pdf_path, exc)
+
+    if not futures:
+        return 1
+    logger.info("processed %d PDF file(s), %d failure(s)", len(futures) - failures, failures)
+    return 0 if failures == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())